@@ -4,12 +4,22 @@ from typing import Dict, List, Optional
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from scraping import OpenAIIntentModel, ScrapingEngine, ScrapingEngineConfig
+from scraping.intent import aclose_client as aclose_intent_client
+
+try:  # pragma: no cover - not available on Windows
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+if uvloop is not None:
+    uvloop.install()
 
 load_dotenv()
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 frontend_url = os.getenv("FRONTEND_URL")
 
 app.add_middleware(
@@ -42,6 +52,12 @@ if openai_key:
 engine = ScrapingEngine(config=ScrapingEngineConfig(), intent_model=intent_model)
 
 
+@app.on_event("shutdown")
+async def shutdown_engine() -> None:
+    await engine.aclose()
+    await aclose_intent_client()
+
+
 @app.post("/submit-job", response_model=ScrapeJobResponse)
 async def submit_job(req: SubmitJobRequest) -> ScrapeJobResponse:
     try:
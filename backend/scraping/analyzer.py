@@ -3,21 +3,179 @@
 from __future__ import annotations
 
 import re
-from difflib import SequenceMatcher
-from typing import Iterable, List, Tuple
+import sys
+import zlib
+from dataclasses import dataclass
+from typing import Callable, ClassVar, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
+import mmh3
+import soupsieve
 from bs4 import BeautifulSoup, Tag
+from rapidfuzz import fuzz
 
 from .types import FieldSpec, ScrapePlan
 
+try:  # pragma: no cover - optional dependency is exercised at runtime
+    from selectolax.parser import HTMLParser as _SelectolaxHTMLParser  # type: ignore
+except Exception:  # pragma: no cover - analyzer falls back to BeautifulSoup
+    _SelectolaxHTMLParser = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency is exercised at runtime
+    import numpy as np
+except Exception:  # pragma: no cover - scoring falls back to fuzzy ratios
+    np = None  # type: ignore[assignment]
+
 _TEXT_SPLIT_RE = re.compile(r"[\s/|>]+")
-_NUMERIC_RE = re.compile(r"(?:[$€£]\s?)?\d[\d,]*(?:\.\d+)?")
-_DATE_PATTERNS = [
-    re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),
-    re.compile(r"\b\d{2}/\d{2}/\d{4}\b"),
-    re.compile(r"\b\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+\d{4}\b", re.IGNORECASE),
-]
+# Numeric and date detection fused into one alternation so each text chunk is
+# scanned a single time; match.lastgroup tells the caller which kind was hit.
+# Date alternatives come first so "2024-01-02" is reported as a date rather
+# than as the leading number.
+_FIELD_SCAN_RE = re.compile(
+    r"(?P<date>\b\d{4}-\d{2}-\d{2}\b"
+    r"|\b\d{2}/\d{2}/\d{4}\b"
+    r"|\b\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+\d{4}\b)"
+    r"|(?P<num>(?:[$€£]\s?)?\d[\d,]*(?:\.\d+)?)",
+    re.IGNORECASE,
+)
+
+
+def _first_scan_match(text: str, kind: str) -> str | None:
+    """Return the first numeric/date hit of ``kind`` in a single pass."""
+
+    for match in _FIELD_SCAN_RE.finditer(text):
+        if match.lastgroup == kind:
+            return match.group(0)
+    return None
+
+
+def _trigrams(value: str) -> set[str]:
+    """Character trigrams of ``value`` padded with word boundaries."""
+
+    padded = f" {value} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+# Hashed-trigram embedding: each string becomes a signed bag of its trigrams
+# projected into a fixed-width vector, L2-normalized, and quantized to the int8
+# range. The dot product of two such vectors approximates trigram-set cosine
+# similarity, so token/synonym scoring reduces to one small integer matmul.
+_VECTOR_DIM = 128
+_QUANT_SCALE = 127
+_QUANT_SCALE_SQ = _QUANT_SCALE * _QUANT_SCALE
+
+
+def _embed(value: str) -> "np.ndarray":
+    vector = np.zeros(_VECTOR_DIM, dtype=np.float32)
+    for gram in _trigrams(value):
+        # crc32 keeps bucket/sign assignment stable across processes, unlike
+        # hash(), which is randomized per interpreter.
+        digest = zlib.crc32(gram.encode("utf-8"))
+        sign = 1.0 if (digest >> 16) & 1 else -1.0
+        vector[digest % _VECTOR_DIM] += sign
+    norm = float(np.linalg.norm(vector))
+    if norm:
+        vector /= norm
+    return np.round(vector * _QUANT_SCALE).astype(np.int32)
+
+
+def _build_trigram_index(synonyms: Tuple[str, ...]) -> dict[str, Tuple[int, ...]]:
+    postings: dict[str, list[int]] = {}
+    for index, synonym in enumerate(synonyms):
+        for gram in _trigrams(synonym):
+            postings.setdefault(gram, []).append(index)
+    return {gram: tuple(ids) for gram, ids in postings.items()}
+
+
+class _DomNode:
+    """Adapter exposing the small BeautifulSoup surface the analyzer relies on
+    (``get``, ``get_text``, ``find_all``, ``select``, ``name``) on top of a
+    selectolax node, keeping the extraction code backend-agnostic."""
+
+    __slots__ = ("_node", "_tree")
+
+    def __init__(self, node, tree=None) -> None:
+        self._node = node
+        # The root adapter keeps the parser alive for the tree's lifetime.
+        self._tree = tree
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    def get(self, attr: str, default=None):
+        attributes = self._node.attributes
+        if attr not in attributes:
+            return default
+        value = attributes[attr] or ""
+        if attr == "class":
+            # BeautifulSoup hands the class attribute back as a list.
+            return value.split()
+        return value
+
+    def get_text(self, separator: str = " ", strip: bool = True) -> str:
+        text = self._node.text(deep=True, separator=separator)
+        if strip:
+            return " ".join(text.split())
+        return text
+
+    def select(self, selector: str) -> List["_DomNode"]:
+        # selectolax subtree queries can match the anchor node itself;
+        # BeautifulSoup.select only ever returns descendants, so filter it out.
+        own = self._node
+        return [_DomNode(node) for node in own.css(selector) if node != own]
+
+    def find_all(self, name=True, recursive: bool = True) -> List["_DomNode"]:
+        if name is True:
+            selector = "*"
+        elif isinstance(name, (list, tuple)):
+            selector = ", ".join(name)
+        else:
+            selector = str(name)
+        return self.select(selector)
+
+
+ElementNode = BeautifulSoup | Tag | _DomNode
+
+
+@dataclass(frozen=True)
+class _ElementFeatures:
+    """Tokenized view of an element, computed once and shared by all fields.
+
+    ``tokens`` is the attribute tokens followed by the text tokens, all
+    lowercased, ready for synonym scoring without further splitting.
+    """
+
+    element: ElementNode
+    text: str
+    text_lower: str
+    tokens: Tuple[str, ...]
+    attr_tokens: Tuple[str, ...]
+    tokens_joined: str
+
+
+@dataclass(frozen=True)
+class _FieldCompiled:
+    """Per-field artifacts compiled once and reused for every element.
+
+    Cached by field content rather than object identity, so equivalent specs
+    (e.g. re-unpickled plans in pool workers) share one entry across pages.
+    """
+
+    selectors: Tuple[str, ...]
+    # Pre-compiled soupsieve matchers for the BeautifulSoup backend; selectolax
+    # caches parsed selectors internally, so the raw strings are used there.
+    compiled_selectors: Tuple[soupsieve.SoupSieve, ...]
+    synonyms: Tuple[str, ...]
+    # Maps character trigrams to the synonyms containing them, so scoring only
+    # runs the fuzzy ratio against synonyms that share a trigram with a token.
+    trigram_index: dict[str, Tuple[int, ...]]
+    # Word-bounded alternation over all synonyms: a cheap exact-match gate run
+    # before any fuzzy scoring. None when the field has no synonyms.
+    synonym_pattern: Optional[re.Pattern[str]]
+    # (n_synonyms, _VECTOR_DIM) int8-range matrix, or None without numpy.
+    synonym_vectors: Optional["np.ndarray"]
+    extractor: Callable[["PageAnalyzer", "ElementNode", FieldSpec, str], str | None]
 
 
 class PageAnalyzer:
@@ -39,11 +197,31 @@ class PageAnalyzer:
     )
 
     def __init__(self) -> None:
-        pass
+        self._field_cache: dict[Tuple, _FieldCompiled] = {}
+        self._descendant_cache: dict[int, List[ElementNode]] = {}
+        self._text_cache: dict[int, Tuple[ElementNode, str]] = {}
+        self._feature_cache: dict[int, _ElementFeatures] = {}
+        # Token embeddings are keyed by value, so they can be reused across
+        # pages; the cap just keeps pathological pages from growing it forever.
+        self._token_vector_cache: dict[str, "np.ndarray"] = {}
+        self._scan_cache: dict[int, Tuple[ElementNode, List[ElementNode], dict[int, dict[str, str]]]] = {}
+        self._value_cache: dict[Tuple[int, str], Tuple[ElementNode, str | None]] = {}
 
     def extract_items(self, html: str, plan: ScrapePlan, *, base_url: str) -> Tuple[List[dict], List[str]]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse(html)
         warnings: List[str] = []
+        self._descendant_cache.clear()
+        self._text_cache.clear()
+        self._feature_cache.clear()
+        self._scan_cache.clear()
+        self._value_cache.clear()
+        if len(self._token_vector_cache) > 65536:
+            self._token_vector_cache.clear()
+
+        # Prime the per-field cache once so selector/synonym compilation never
+        # happens inside the per-element loops below.
+        for field in plan.fields:
+            self._compiled(field)
 
         candidate_groups = self._find_repeating_groups(soup)
         if not candidate_groups:
@@ -69,10 +247,52 @@ class PageAnalyzer:
     # Container analysis
     # ------------------------------------------------------------------
 
-    def _find_repeating_groups(self, soup: BeautifulSoup) -> List[List[Tag]]:
-        signature_map: dict[Tuple[str, Tuple[str, ...], str], List[Tag]] = {}
-        candidate_tags = ["article", "li", "tr", "section", "div"]
-        for element in soup.find_all(candidate_tags):
+    CANDIDATE_GROUP_TAGS = ("article", "li", "tr", "section", "div")
+
+    def _find_repeating_groups(self, soup: ElementNode) -> List[List[ElementNode]]:
+        elements = soup.find_all(list(self.CANDIDATE_GROUP_TAGS))
+        if np is None:
+            return self._find_repeating_groups_dict(elements)
+
+        # Structure-of-arrays layout: one interned integer per signature
+        # component, grouped with a single vectorized np.unique pass instead of
+        # building a tuple key and dict entry per element.
+        name_ids: dict[str, int] = {}
+        role_ids: dict[str, int] = {}
+        kept: List[ElementNode] = []
+        rows: List[Tuple[int, int, int]] = []
+        for element in elements:
+            classes = element.get("class", [])
+            role = element.get("role", "")
+            name = element.name
+            if not classes and not role and name not in {"article", "li", "tr"}:
+                continue
+            kept.append(element)
+            rows.append(
+                (
+                    name_ids.setdefault(name, len(name_ids)),
+                    mmh3.hash64(b"\x00".join(sorted(cls.encode() for cls in classes)))[0],
+                    role_ids.setdefault(role, len(role_ids)),
+                )
+            )
+        if not kept:
+            return []
+
+        columns = np.asarray(rows, dtype=np.int64)
+        _, inverse, counts = np.unique(columns, axis=0, return_inverse=True, return_counts=True)
+        group_ids = [int(gid) for gid in np.flatnonzero(counts >= 2)]
+        group_ids.sort(key=lambda gid: int(counts[gid]), reverse=True)
+
+        groups: List[List[ElementNode]] = []
+        # Limit to the top few groups to avoid over-processing.
+        for gid in group_ids[:5]:
+            members = np.flatnonzero(inverse == gid)
+            groups.append([kept[int(index)] for index in members])
+        return groups
+
+    def _find_repeating_groups_dict(self, elements: Iterable[ElementNode]) -> List[List[ElementNode]]:
+        signature_map: dict[Tuple[str, Tuple[str, ...], str], List[ElementNode]] = {}
+        for element in elements:
             signature = self._signature(element)
             if not signature:
                 continue
@@ -83,7 +303,7 @@ class PageAnalyzer:
         # Limit to the top few groups to avoid over-processing.
         return groups[:5]
 
-    def _signature(self, element: Tag) -> Tuple[str, Tuple[str, ...], str] | None:
+    def _signature(self, element: ElementNode) -> Tuple[str, Tuple[str, ...], str] | None:
         classes = tuple(sorted(element.get("class", [])))
         role = element.get("role", "")
         if not classes and not role and element.name not in {"article", "li", "tr"}:
@@ -94,7 +314,7 @@ class PageAnalyzer:
     # Field extraction
     # ------------------------------------------------------------------
 
-    def _extract_from_node(self, node: Tag | BeautifulSoup, fields: Iterable[FieldSpec], base_url: str) -> dict:
+    def _extract_from_node(self, node: ElementNode, fields: Iterable[FieldSpec], base_url: str) -> dict:
         record: dict = {}
         for field in fields:
             value = self._extract_field(node, field, base_url)
@@ -102,29 +322,35 @@ class PageAnalyzer:
                 record[field.name] = value
         return record
 
-    def _extract_field(self, node: Tag | BeautifulSoup, field: FieldSpec, base_url: str) -> str | None:
+    def _extract_field(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
+        # Candidate groups frequently share subtrees; remember each
+        # element/field outcome (including misses) so overlapping groups never
+        # re-extract the same value. Reset per extract_items call.
+        key = (id(node), field.name)
+        cached = self._value_cache.get(key)
+        if cached is not None:
+            return cached[1]
+        value = self._extract_field_uncached(node, field, base_url)
+        self._value_cache[key] = (node, value)
+        return value
+
+    def _extract_field_uncached(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
+        compiled = self._compiled(field)
         selector_value = self._extract_using_selectors(node, field, base_url)
         if selector_value:
             return selector_value.strip()
 
-        extractor = {
-            "link": self._extract_link,
-            "image": self._extract_image,
-            "numeric": self._extract_numeric,
-            "date": self._extract_date,
-        }.get(field.value_type, self._extract_text)
-        value = extractor(node, field, base_url)
+        value = compiled.extractor(self, node, field, base_url)
         if value:
             return value.strip()
         return None
 
-    def _extract_using_selectors(self, node: Tag | BeautifulSoup, field: FieldSpec, base_url: str) -> str | None:
-        selectors = self._candidate_selectors(field)
-        if not selectors:
+    def _extract_using_selectors(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
+        compiled = self._compiled(field)
+        if not compiled.selectors:
             return None
 
-        for selector in selectors:
-            matches = node.select(selector)
+        for matches in self._select_matches(node, compiled):
             if not matches:
                 continue
             if field.value_type == "link":
@@ -145,24 +371,24 @@ class PageAnalyzer:
                     if not text:
                         continue
                     if field.value_type == "numeric":
-                        match = _NUMERIC_RE.search(text)
-                        if match:
-                            return match.group(0)
+                        value = _first_scan_match(text, "num")
+                        if value:
+                            return value
                     else:
                         return text
         return None
 
-    def _extract_text(self, node: Tag | BeautifulSoup, field: FieldSpec, base_url: str) -> str | None:
+    def _extract_text(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
         best_score = 0.0
         best_value: str | None = None
         for element in self._iter_elements(node):
-            text = element.get_text(" ", strip=True)
-            if not text:
+            features = self._features(element)
+            if not features.text:
                 continue
-            score = self._score_element(element, field, text)
+            score = self._score_element(features, field)
             if score > 0.6 and (score > best_score or best_value is None):
                 best_score = score
-                best_value = text
+                best_value = features.text
 
         if best_value:
             return best_value
@@ -173,58 +399,46 @@ class PageAnalyzer:
             return " ".join(text_content.split()[:30])
         return None
 
-    def _extract_numeric(self, node: Tag | BeautifulSoup, field: FieldSpec, base_url: str) -> str | None:
+    def _extract_numeric(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
         best_value = None
         best_score = 0.0
-        for element in self._iter_elements(node):
-            text = element.get_text(" ", strip=True)
-            if not text:
-                continue
-            match = _NUMERIC_RE.search(text)
-            if not match:
+        elements, hits = self._scan_node(node)
+        for index, element in enumerate(elements):
+            value = hits.get(index, {}).get("num")
+            if not value:
                 continue
-            score = self._score_element(element, field, text)
+            score = self._score_element(self._features(element), field)
             if score > 0.45 and score >= best_score:
                 best_score = score
-                best_value = match.group(0)
+                best_value = value
         if best_value:
             return best_value
 
-        fallback = _NUMERIC_RE.search(node.get_text(" ", strip=True))
-        if fallback:
-            return fallback.group(0)
-        return None
+        # Element 0 is the node itself, whose text spans the whole subtree.
+        return hits.get(0, {}).get("num")
 
-    def _extract_date(self, node: Tag | BeautifulSoup, field: FieldSpec, base_url: str) -> str | None:
-        for element in self._iter_elements(node):
-            text = element.get_text(" ", strip=True)
-            if not text:
-                continue
-            for pattern in _DATE_PATTERNS:
-                match = pattern.search(text)
-                if match and self._score_element(element, field, text) > 0.4:
-                    return match.group(0)
-        text = node.get_text(" ", strip=True)
-        for pattern in _DATE_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                return match.group(0)
-        return None
+    def _extract_date(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
+        elements, hits = self._scan_node(node)
+        for index, element in enumerate(elements):
+            value = hits.get(index, {}).get("date")
+            if value and self._score_element(self._features(element), field) > 0.4:
+                return value
+        return hits.get(0, {}).get("date")
 
-    def _extract_link(self, node: Tag | BeautifulSoup, field: FieldSpec, base_url: str) -> str | None:
+    def _extract_link(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
         best_value = None
         best_score = 0.0
         for element in node.find_all("a"):
             href = element.get("href")
             if not href:
                 continue
-            score = self._score_element(element, field, element.get_text(" ", strip=True))
+            score = self._score_element(self._features(element), field)
             if score > 0.4 and score >= best_score:
                 best_score = score
                 best_value = urljoin(base_url, href)
         return best_value
 
-    def _extract_image(self, node: Tag | BeautifulSoup, field: FieldSpec, base_url: str) -> str | None:
+    def _extract_image(self, node: ElementNode, field: FieldSpec, base_url: str) -> str | None:
         best_value = None
         best_score = 0.0
         for element in node.find_all("img"):
@@ -233,7 +447,7 @@ class PageAnalyzer:
                 value = element.get(attr)
                 if not value:
                     continue
-                score = self._score_element(element, field, element.get("alt", ""))
+                score = self._score_element(self._features(element), field, text=element.get("alt", ""))
                 if score > 0.3 and score >= best_score:
                     best_score = score
                     best_value = urljoin(base_url, value)
@@ -243,35 +457,194 @@ class PageAnalyzer:
     # Utility helpers
     # ------------------------------------------------------------------
 
-    def _iter_elements(self, node: Tag | BeautifulSoup) -> Iterable[Tag]:
-        if isinstance(node, BeautifulSoup):
-            yield node
-            iterable = node.find_all(True)
+    def _element_text(self, element: ElementNode) -> str:
+        # Several extractors visit the same elements for different fields;
+        # materialize each element's text once per page. The cached entry keeps
+        # a reference to its element so id() keys cannot be recycled while the
+        # cache (cleared per extract_items call) is live.
+        cached = self._text_cache.get(id(element))
+        if cached is not None:
+            return cached[1]
+        text = element.get_text(" ", strip=True)
+        self._text_cache[id(element)] = (element, text)
+        return text
+
+    def _scan_node(self, node: ElementNode) -> Tuple[List[ElementNode], dict[int, dict[str, str]]]:
+        """Scan a node's descendants for numeric/date hits in one regex pass.
+
+        All element texts are joined with a NUL sentinel (which, unlike
+        ``\\x1f``-range separators, is not regex whitespace, so no pattern can
+        match across it) and scanned once; each hit is mapped back to its owning
+        element by binary search over the cumulative offsets. Returns the
+        element list and, per element index, the first hit of each kind.
+        """
+
+        cached = self._scan_cache.get(id(node))
+        if cached is not None:
+            return cached[1], cached[2]
+
+        elements = list(self._iter_elements(node))
+        texts = [self._element_text(element) for element in elements]
+        hits: dict[int, dict[str, str]] = {}
+        if np is None:
+            for index, text in enumerate(texts):
+                if not text:
+                    continue
+                bucket: dict[str, str] = {}
+                for match in _FIELD_SCAN_RE.finditer(text):
+                    bucket.setdefault(match.lastgroup, match.group(0))
+                if bucket:
+                    hits[index] = bucket
         else:
-            yield node
-            iterable = node.find_all(True, recursive=True)
-        for element in iterable:
-            yield element
-
-    def _score_element(self, element: Tag, field: FieldSpec, text: str) -> float:
+            joined = "\x00".join(texts)
+            ends = np.cumsum(np.fromiter((len(text) + 1 for text in texts), dtype=np.int64, count=len(texts)))
+            for match in _FIELD_SCAN_RE.finditer(joined):
+                index = int(np.searchsorted(ends, match.start(), side="right"))
+                hits.setdefault(index, {}).setdefault(match.lastgroup, match.group(0))
+
+        self._scan_cache[id(node)] = (node, elements, hits)
+        return elements, hits
+
+    def _features(self, element: ElementNode) -> _ElementFeatures:
+        cached = self._feature_cache.get(id(element))
+        if cached is not None:
+            return cached
+
+        # Tokens are interned so repeated class/attribute values across a page
+        # hash and compare by pointer in the scoring caches.
         attr_tokens: List[str] = []
         for attr in self.ATTRIBUTE_TOKENS:
             value = element.get(attr)
             if not value:
                 continue
             if isinstance(value, list):
-                attr_tokens.extend(value)
+                attr_tokens.extend(sys.intern(token.lower()) for token in value)
             else:
-                attr_tokens.extend(_TEXT_SPLIT_RE.split(str(value)))
-
-        text_tokens = _TEXT_SPLIT_RE.split(text.lower())
-        tokens = [token for token in attr_tokens + text_tokens if token]
+                attr_tokens.extend(sys.intern(token.lower()) for token in _TEXT_SPLIT_RE.split(str(value)))
+
+        text = self._element_text(element)
+        text_lower = text.lower()
+        attr_tuple = tuple(token for token in attr_tokens if token)
+        text_tokens = tuple(sys.intern(token) for token in _TEXT_SPLIT_RE.split(text_lower) if token)
+        tokens = attr_tuple + text_tokens
+        features = _ElementFeatures(
+            element=element,
+            text=text,
+            text_lower=text_lower,
+            tokens=tokens,
+            attr_tokens=attr_tuple,
+            tokens_joined=" ".join(tokens),
+        )
+        self._feature_cache[id(element)] = features
+        return features
+
+    def _select_matches(self, node: ElementNode, compiled: _FieldCompiled) -> Iterable[List[ElementNode]]:
+        if isinstance(node, _DomNode):
+            for selector in compiled.selectors:
+                yield node.select(selector)
+        else:
+            for matcher in compiled.compiled_selectors:
+                yield matcher.select(node)
+
+    def _parse(self, html: str) -> ElementNode:
+        if _SelectolaxHTMLParser is not None:
+            tree = _SelectolaxHTMLParser(html)
+            if tree.root is not None:
+                return _DomNode(tree.root, tree=tree)
+        return BeautifulSoup(html, "lxml")
+
+    def _compiled(self, field: FieldSpec) -> _FieldCompiled:
+        # Content key: pool workers receive freshly unpickled FieldSpec objects
+        # per task, so an identity key would never hit and grow without bound.
+        key = (
+            field.name,
+            field.value_type,
+            field.synonyms_sorted,
+            tuple(field.attribute_preferences),
+            field.allow_partial,
+        )
+        compiled = self._field_cache.get(key)
+        if compiled is None:
+            selectors = tuple(self._candidate_selectors(field))
+            synonyms = field.synonyms_sorted
+            compiled = _FieldCompiled(
+                selectors=selectors,
+                compiled_selectors=tuple(soupsieve.compile(selector) for selector in selectors),
+                synonyms=synonyms,
+                trigram_index=_build_trigram_index(synonyms),
+                synonym_pattern=(
+                    re.compile("|".join(rf"\b{re.escape(synonym)}\b" for synonym in synonyms)) if synonyms else None
+                ),
+                synonym_vectors=np.stack([_embed(synonym) for synonym in synonyms]) if np is not None and synonyms else None,
+                extractor=self._EXTRACTORS.get(field.value_type, PageAnalyzer._extract_text),
+            )
+            self._field_cache[key] = compiled
+        return compiled
+
+    def _iter_elements(self, node: ElementNode) -> Iterable[ElementNode]:
+        # The same node is walked once per field; materialize its descendants a
+        # single time per page and hand out the cached list afterwards. The
+        # cache is cleared at the top of extract_items, and every node stays
+        # alive for the duration of that call, so id() keys are stable here.
+        cached = self._descendant_cache.get(id(node))
+        if cached is None:
+            cached = [node, *node.find_all(True)]
+            self._descendant_cache[id(node)] = cached
+        return cached
+
+    def _score_element(self, features: _ElementFeatures, field: FieldSpec, *, text: str | None = None) -> float:
+        # ``text`` overrides the element's own text (e.g. an image's alt
+        # attribute); otherwise the precomputed token tuple is used as-is.
+        if text is None:
+            tokens: Tuple[str, ...] = features.tokens
+            haystack = features.tokens_joined
+        else:
+            extra = tuple(token for token in _TEXT_SPLIT_RE.split(text.lower()) if token)
+            tokens = features.attr_tokens + extra
+            haystack = " ".join(tokens)
+        compiled = self._compiled(field)
+        synonyms = compiled.synonyms
+        if not tokens or not synonyms:
+            return 0.0
+
+        # Most fields match a class name or attribute exactly; answer those
+        # with one substring scan and keep similarity scoring for near-misses.
+        if compiled.synonym_pattern is not None and compiled.synonym_pattern.search(haystack):
+            return 1.0
+
+        if compiled.synonym_vectors is not None:
+            return self._vector_score(tokens, compiled)
+
+        # Synonyms are lowercased once at FieldSpec construction, so tokens can
+        # be compared without further normalization. The trigram index narrows
+        # each token down to the synonyms it could plausibly match, so the
+        # fuzzy ratio only runs on those candidates instead of every pair.
+        index = compiled.trigram_index
         best = 0.0
         for token in tokens:
-            for synonym in field.synonyms:
-                ratio = SequenceMatcher(None, token.lower(), synonym).ratio()
-                best = max(best, ratio)
-        return best
+            candidate_ids: set[int] = set()
+            for gram in _trigrams(token):
+                candidate_ids.update(index.get(gram, ()))
+            for candidate_id in candidate_ids:
+                best = max(best, fuzz.ratio(token, synonyms[candidate_id], score_cutoff=60))
+                if best >= 100.0:
+                    return 1.0
+        return best / 100.0
+
+    def _vector_score(self, tokens: Tuple[str, ...], compiled: _FieldCompiled) -> float:
+        cache = self._token_vector_cache
+        vectors = []
+        for token in tokens:
+            vector = cache.get(token)
+            if vector is None:
+                vector = _embed(token)
+                cache[token] = vector
+            vectors.append(vector)
+        scores = np.stack(vectors) @ compiled.synonym_vectors.T
+        best = int(scores.max())
+        if best <= 0:
+            return 0.0
+        return min(best / _QUANT_SCALE_SQ, 1.0)
 
     def _candidate_selectors(self, field: FieldSpec) -> List[str]:
         tokens = {field.name.lower(), *field.synonyms}
@@ -300,3 +673,11 @@ class PageAnalyzer:
                 ordered.append(selector)
                 seen.add(selector)
         return ordered
+
+    # Built once per class; unknown value types fall back to text extraction.
+    _EXTRACTORS: ClassVar[dict] = {
+        "link": _extract_link,
+        "image": _extract_image,
+        "numeric": _extract_numeric,
+        "date": _extract_date,
+    }
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .analyzer import PageAnalyzer
 from .fetcher import BrowserCollector, BrowserSettings
@@ -23,6 +26,19 @@ class ScrapingEngineConfig:
     http_headers: Optional[dict[str, str]] = None
 
 
+# One analyzer per pool worker; its per-field caches survive across pages.
+_worker_analyzer: Optional[PageAnalyzer] = None
+
+
+def _extract_in_worker(html: str, plan: ScrapePlan, base_url: str) -> Tuple[List[dict], List[str]]:
+    """Run page extraction inside a process-pool worker."""
+
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = PageAnalyzer()
+    return _worker_analyzer.extract_items(html, plan, base_url=base_url)
+
+
 class ScrapingEngine:
     """An intelligent data extraction system for arbitrary web pages."""
 
@@ -34,7 +50,7 @@ class ScrapingEngine:
         intent_model: Optional[IntentModel] = None,
     ) -> None:
         self._config = config or ScrapingEngineConfig()
-        library = field_library or default_field_library()
+        library = field_library or dict(default_field_library())
         self._planner = PromptPlanner(
             field_library=library,
             settings=PlannerSettings(default_fields=["title", "description", "url"]),
@@ -47,6 +63,9 @@ class ScrapingEngine:
         )
         self._analyzer = PageAnalyzer()
         self._refiner = DataRefiner()
+        # Parsing and fuzzy scoring are CPU-bound; running them on the event
+        # loop would serialize pages and stall concurrent requests.
+        self._extract_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
 
     async def run(self, prompt: str, *, max_pages: Optional[int] = None) -> ScrapeOutcome:
         """Execute the scraping pipeline for the given natural language prompt."""
@@ -67,14 +86,24 @@ class ScrapingEngine:
         errors: List[str] = []
         source_urls: List[str] = []
 
+        loop = asyncio.get_running_loop()
+        jobs: List[Tuple[str, asyncio.Future]] = []
         for page in pages:
             page_url = page.final_url or page.url
             source_urls.append(page_url)
             if not page.success():
                 errors.append(f"{page_url}: {page.error or 'unknown error'}")
                 continue
+            jobs.append(
+                (page_url, loop.run_in_executor(self._extract_pool, _extract_in_worker, page.html, plan, page_url))
+            )
 
-            extracted, page_warnings = self._analyzer.extract_items(page.html, plan, base_url=page_url)
+        results = await asyncio.gather(*(job for _, job in jobs), return_exceptions=True)
+        for (page_url, _), result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                errors.append(f"{page_url}: extraction failed ({result.__class__.__name__}: {result})")
+                continue
+            extracted, page_warnings = result
             if not extracted:
                 warnings.append(f"{page_url}: no matching data located.")
             else:
@@ -98,6 +127,12 @@ class ScrapingEngine:
             stats=stats,
         )
 
+    async def aclose(self) -> None:
+        """Release the shared browser session and the extraction pool."""
+
+        await self._fetcher.aclose()
+        self._extract_pool.shutdown(wait=False, cancel_futures=True)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
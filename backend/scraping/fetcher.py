@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Sequence, Tuple
@@ -48,6 +49,9 @@ class BrowserSettings:
     max_concurrent_pages: int = 2
     viewport: Tuple[int, int] = (1280, 720)
     auto_scroll_pause: float = 0.35
+    # How long fetched HTTP responses may be served from the in-process cache;
+    # zero disables caching entirely.
+    http_cache_ttl: float = 300.0
 
 
 class BrowserCollector:
@@ -61,7 +65,15 @@ class BrowserCollector:
         http_headers: Optional[dict] = None,
     ) -> None:
         self._settings = settings or BrowserSettings()
-        self._http_fallback = _HttpFallbackFetcher(timeout=http_timeout, headers=http_headers)
+        self._http_fallback = _HttpFallbackFetcher(
+            timeout=http_timeout,
+            headers=http_headers,
+            cache_ttl=self._settings.http_cache_ttl,
+        )
+        # Browser startup costs 500ms-2s; keep one session alive across
+        # fetch_all calls and only open/close pages per URL.
+        self._session: Optional[BrowserSession] = None
+        self._session_lock = asyncio.Lock()
 
     async def fetch_all(
         self,
@@ -80,21 +92,23 @@ class BrowserCollector:
             return pages, warnings, {"transport": "http"}
 
         try:
-            async with BrowserSession(self._settings) as session:
-                semaphore = asyncio.Semaphore(max(1, self._settings.max_concurrent_pages))
+            session = await self._get_session()
+            semaphore = asyncio.Semaphore(max(1, self._settings.max_concurrent_pages))
 
-                async def run(url: str) -> PageContent:
-                    async with semaphore:
-                        return await session.open(url, interactions)
+            async def run(url: str) -> PageContent:
+                async with semaphore:
+                    return await session.open(url, interactions)
 
-                tasks = [asyncio.create_task(run(url)) for url in urls_list]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [asyncio.create_task(run(url)) for url in urls_list]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         except Exception as exc:  # pragma: no cover - depends on runtime environment
             logger.exception("Browser automation failed; using HTTP fallback.")
             warnings.append(
                 "Browser automation failed; falling back to static HTTP fetching."
                 f" ({exc.__class__.__name__}: {exc})",
             )
+            # Drop the (possibly dead) session so the next call relaunches.
+            await self.aclose()
             pages = await self._http_fallback.fetch_all(urls_list)
             return pages, warnings, {"transport": "http"}
 
@@ -114,6 +128,25 @@ class BrowserCollector:
             metadata["fallback_urls"] = fallback_urls
         return pages, warnings, metadata
 
+    async def _get_session(self) -> BrowserSession:
+        async with self._session_lock:
+            if self._session is None:
+                session = BrowserSession(self._settings)
+                await session.start()
+                self._session = session
+            return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared browser session, if one was started."""
+
+        async with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            try:
+                await session.close()
+            except Exception:  # pragma: no cover - teardown of a dead browser
+                logger.debug("Ignoring error while closing browser session.", exc_info=True)
+
 
 class BrowserSession:
     """Thin wrapper around Playwright to orchestrate automation flows."""
@@ -126,7 +159,7 @@ class BrowserSession:
         self._browser = None
         self._context = None
 
-    async def __aenter__(self) -> "BrowserSession":
+    async def start(self) -> "BrowserSession":
         self._playwright = await async_playwright().start()
         browser_getter = getattr(self._playwright, self._settings.browser)
         self._browser = await browser_getter.launch(headless=self._settings.headless)
@@ -134,7 +167,7 @@ class BrowserSession:
         self._context = await self._browser.new_context(viewport=viewport, ignore_https_errors=True)
         return self
 
-    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - teardown
+    async def close(self) -> None:  # pragma: no cover - teardown
         if self._context:
             await self._context.close()
         if self._browser:
@@ -142,6 +175,12 @@ class BrowserSession:
         if self._playwright:
             await self._playwright.stop()
 
+    async def __aenter__(self) -> "BrowserSession":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - teardown
+        await self.close()
+
     async def open(self, url: str, interactions: Sequence[InteractionStep]) -> PageContent:
         if not self._context:  # pragma: no cover - safety guard
             raise RuntimeError("Browser context has not been initialized.")
@@ -154,7 +193,7 @@ class BrowserSession:
                 timeout=self._settings.navigation_timeout_ms,
             )
             await self._perform_interactions(page, interactions)
-            html = await page.content()
+            html = await self._page_html(page)
             final_url = page.url
             status = response.status if response else None
             return PageContent(url=url, final_url=final_url, status_code=status, html=html, error=None)
@@ -165,6 +204,27 @@ class BrowserSession:
         finally:
             await page.close()
 
+    async def _page_html(self, page: Page) -> str:
+        # page.content() re-serializes the DOM through Playwright's own
+        # protocol wrapper; on Chromium a raw CDP Runtime.evaluate hands back
+        # outerHTML in a single hop with one less copy of the payload.
+        if self._settings.browser == "chromium" and self._context is not None:
+            try:
+                cdp = await self._context.new_cdp_session(page)
+                try:
+                    result = await cdp.send(
+                        "Runtime.evaluate",
+                        {"expression": "document.documentElement.outerHTML", "returnByValue": True},
+                    )
+                    value = result.get("result", {}).get("value")
+                    if isinstance(value, str) and value:
+                        return value
+                finally:
+                    await cdp.detach()
+            except Exception:  # pragma: no cover - depends on browser runtime
+                logger.debug("CDP snapshot failed; using page.content().", exc_info=True)
+        return await page.content()
+
     async def _perform_interactions(self, page: Page, interactions: Sequence[InteractionStep]) -> None:
         for step in interactions:
             try:
@@ -186,23 +246,48 @@ class BrowserSession:
                 logger.warning("Interaction '%s' failed on %s: %s", step.kind, page.url, exc)
 
     async def _scroll(self, page: Page, *, count: int, pause: Optional[float]) -> None:
-        for _ in range(count):
-            await page.mouse.wheel(0, 8000)
-            await asyncio.sleep(pause or self._settings.auto_scroll_pause)
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+        # Run the whole scroll+wait loop inside the page: one browser
+        # round-trip total instead of three per iteration.
+        pause_ms = int((pause or self._settings.auto_scroll_pause) * 1000)
+        await page.evaluate(
+            """async ({count, pauseMs}) => {
+                for (let i = 0; i < count; i++) {
+                    window.scrollBy(0, 8000);
+                    await new Promise((resolve) => setTimeout(resolve, pauseMs));
+                    window.scrollTo(0, document.body.scrollHeight);
+                }
+            }""",
+            {"count": count, "pauseMs": pause_ms},
+        )
 
 
 class _HttpFallbackFetcher:
     """Fallback HTML fetcher used when browser automation is unavailable."""
 
-    def __init__(self, *, timeout: float, headers: Optional[dict]) -> None:
+    # Scrape batches usually hit one or a few hosts; HTTP/2 multiplexes many
+    # requests per connection, and the semaphore keeps a single origin from
+    # being flooded even with a large pool.
+    MAX_CONCURRENT_REQUESTS = 32
+
+    def __init__(self, *, timeout: float, headers: Optional[dict], cache_ttl: float = 0.0) -> None:
         self._timeout = timeout
         self._headers = {**DEFAULT_HEADERS, **(headers or {})}
-        self._limits = httpx.Limits(max_connections=6, max_keepalive_connections=6)
+        self._limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        # Planner pagination frequently revisits the same URLs; successful
+        # responses are replayed from memory while their TTL lasts.
+        self._cache_ttl = cache_ttl
+        self._cache: dict[str, Tuple[float, PageContent]] = {}
+        self._cache_lock = asyncio.Lock()
 
     @asynccontextmanager
     async def client(self) -> httpx.AsyncClient:
-        async with httpx.AsyncClient(headers=self._headers, timeout=self._timeout, limits=self._limits, follow_redirects=True) as client:
+        async with httpx.AsyncClient(
+            headers=self._headers,
+            timeout=self._timeout,
+            limits=self._limits,
+            follow_redirects=True,
+            http2=True,
+        ) as client:
             yield client
 
     async def fetch_all(self, urls: Iterable[str]) -> List[PageContent]:
@@ -210,8 +295,14 @@ class _HttpFallbackFetcher:
         if not urls_list:
             return []
 
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(url: str) -> PageContent:
+            async with semaphore:
+                return await self._fetch_single(client, url)
+
         async with self.client() as client:
-            tasks = [self._fetch_single(client, url) for url in urls_list]
+            tasks = [fetch(url) for url in urls_list]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
         pages: List[PageContent] = []
@@ -223,17 +314,23 @@ class _HttpFallbackFetcher:
         return pages
 
     async def _fetch_single(self, client: httpx.AsyncClient, url: str) -> PageContent:
+        cached = await self._cache_lookup(url)
+        if cached is not None:
+            return cached
+
         try:
             response = await client.get(url)
             response.raise_for_status()
             final_url = str(response.url)
-            return PageContent(
+            page = PageContent(
                 url=url,
                 final_url=final_url,
                 status_code=response.status_code,
                 html=response.text,
                 error=None,
             )
+            await self._cache_store(url, page)
+            return page
         except httpx.HTTPStatusError as exc:
             return PageContent(
                 url=url,
@@ -244,3 +341,27 @@ class _HttpFallbackFetcher:
             )
         except Exception as exc:  # noqa: BLE001 - propagate as payload error
             return PageContent(url=url, final_url=url, status_code=None, html="", error=str(exc))
+
+    async def _cache_lookup(self, url: str) -> Optional[PageContent]:
+        if self._cache_ttl <= 0:
+            return None
+        async with self._cache_lock:
+            entry = self._cache.get(url)
+            if entry is None:
+                return None
+            fetched_at, page = entry
+            if time.monotonic() - fetched_at >= self._cache_ttl:
+                del self._cache[url]
+                return None
+            return page
+
+    async def _cache_store(self, url: str, page: PageContent) -> None:
+        if self._cache_ttl <= 0:
+            return
+        now = time.monotonic()
+        async with self._cache_lock:
+            if len(self._cache) > 256:
+                self._cache = {
+                    key: entry for key, entry in self._cache.items() if now - entry[0] < self._cache_ttl
+                }
+            self._cache[url] = (now, page)
@@ -2,19 +2,54 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
+import simdjson
 
 from .planner import IntentModel, IntentSuggestion
 from .types import InteractionStep
 
 logger = logging.getLogger(__name__)
 
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Reusable SIMD parser for the response envelope. Lazy element access means
+# only choices[0].message.content is materialized as a Python object; the
+# envelope's usage/fingerprint metadata is never converted. The parsed
+# document is only valid until the next parse, so extraction happens
+# immediately, without suspension points in between.
+_ENVELOPE_PARSER = simdjson.Parser()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared API client, creating it on first use.
+
+    Reusing one client keeps pooled keepalive connections to api.openai.com
+    warm across calls instead of paying a TCP+TLS handshake per request.
+    """
+
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _CLIENT
+
+
+async def aclose_client() -> None:
+    """Close the shared API client if one was created."""
+
+    global _CLIENT
+    client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.aclose()
+
 
 @dataclass
 class OpenAIIntentModel(IntentModel):
@@ -58,23 +93,24 @@ class OpenAIIntentModel(IntentModel):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    json=payload,
-                    headers=headers,
-                )
-                response.raise_for_status()
-            except Exception as exc:  # pragma: no cover - depends on network availability
-                logger.warning("OpenAI intent analysis failed: %s", exc)
-                return None
+        client = _get_client()
+        try:
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                content=orjson.dumps(payload),
+                headers=headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except Exception as exc:  # pragma: no cover - depends on network availability
+            logger.warning("OpenAI intent analysis failed: %s", exc)
+            return None
 
         try:
-            data = response.json()
-            content = data["choices"][0]["message"]["content"]
-            parsed = json.loads(content)
-        except (KeyError, json.JSONDecodeError) as exc:  # pragma: no cover - depends on API output
+            envelope = _ENVELOPE_PARSER.parse(response.content)
+            content = str(envelope["choices"][0]["message"]["content"])
+            parsed = orjson.loads(content)
+        except (KeyError, IndexError, ValueError) as exc:  # pragma: no cover - depends on API output
             logger.warning("Failed to parse OpenAI intent response: %s", exc)
             return None
 
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+
+import ahocorasick
 from typing import Dict, Iterable, List, Optional, Protocol
 from urllib.parse import urlparse
 
@@ -21,6 +26,29 @@ logger = logging.getLogger(__name__)
 _URL_RE = re.compile(r"https?://[^\s]+", re.IGNORECASE)
 _PAGE_RANGE_RE = re.compile(r"(?:first|top)\s+(\d+)\s+pages?", re.IGNORECASE)
 _GENERIC_COUNT_RE = re.compile(r"(\d+)\s+pages?", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
+_FIELD_SPLIT_RE = re.compile(r"[,/]| and ")
+_PAGE_PATH_RE = re.compile(r"/page/(\d+)")
+_URL_TAIL_RE = re.compile(r"[.,)'\"]+$")
+
+
+@lru_cache(maxsize=1024)
+def _cached_urlparse(url: str):
+    return urlparse(url)
+
+# Interaction keywords tagged with the intent bucket they contribute to.
+_INTERACTION_KEYWORDS = (
+    ("scroll", "scroll"),
+    ("infinite", "scroll"),
+    ("load more", "scroll"),
+    ("keep loading", "scroll"),
+    ("wait", "wait"),
+    ("appear", "ready"),
+    ("render", "ready"),
+    ("load", "ready"),
+    ("click", "click"),
+    ("more", "more"),
+)
 
 
 class IntentModel(Protocol):
@@ -53,18 +81,29 @@ class IntentSuggestion:
 
         if other.seed_url:
             self.seed_url = other.seed_url
+        # Append-only dedup: existing entries stay in place and only genuinely
+        # new values allocate, instead of rebuilding the merged list each time.
         if other.extra_urls:
-            extras = list(dict.fromkeys(self.extra_urls + other.extra_urls))
-            self.extra_urls = extras
+            seen = set(self.extra_urls)
+            for url in other.extra_urls:
+                if url not in seen:
+                    self.extra_urls.append(url)
+                    seen.add(url)
         if other.field_names:
-            combined = list(dict.fromkeys(self.field_names + other.field_names))
-            self.field_names = combined
+            seen = set(self.field_names)
+            for name in other.field_names:
+                if name not in seen:
+                    self.field_names.append(name)
+                    seen.add(name)
         if other.max_pages is not None:
             self.max_pages = other.max_pages
         if other.interactions:
-            merged = {(step.kind, step.selector or "", step.value or ""): step for step in self.interactions}
-            for step in other.interactions:
-                merged[(step.kind, step.selector or "", step.value or "")] = step
+            # Later inserts overwrite earlier ones, so the other suggestion
+            # still wins on key collisions.
+            merged = {
+                (step.kind, step.selector or "", step.value or ""): step
+                for step in chain(self.interactions, other.interactions)
+            }
             self.interactions = list(merged.values())
         if other.notes:
             self.notes.extend(other.notes)
@@ -88,16 +127,34 @@ class PromptPlanner:
         settings: Optional[PlannerSettings] = None,
         intent_model: Optional[IntentModel] = None,
     ) -> None:
-        self._library = field_library or default_field_library()
+        self._library = field_library or dict(default_field_library())
         self._settings = settings or PlannerSettings(default_fields=["title", "description", "url"])
         self._intent_model = intent_model
+        # Reverse index from field names and synonyms to the owning field so
+        # token classification is a dict lookup instead of a scan per field.
+        self._synonym_index: Dict[str, str] = {}
+        for name, spec in self._library.items():
+            self._synonym_index.setdefault(name, name)
+            for synonym in spec.synonyms_sorted:
+                self._synonym_index.setdefault(synonym, name)
+        # Multi-pattern keyword automaton: one pass over the prompt finds all
+        # interaction hints instead of one substring scan per keyword.
+        self._kw_automaton = ahocorasick.Automaton()
+        for keyword, tag in _INTERACTION_KEYWORDS:
+            self._kw_automaton.add_word(keyword, tag)
+        self._kw_automaton.make_automaton()
 
     async def plan(self, prompt: str, *, max_pages: Optional[int] = None) -> ScrapePlan:
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty.")
 
-        heuristic = self._heuristic_intent(prompt, max_pages=max_pages)
-        model_suggestion = await self._query_intent_model(prompt)
+        # Kick off the model request first so the heuristic CPU work runs
+        # while the network round-trip is in flight; wall-clock latency is
+        # then max(heuristic, model) instead of their sum.
+        loop = asyncio.get_running_loop()
+        model_task = asyncio.create_task(self._query_intent_model(prompt))
+        heuristic_task = loop.run_in_executor(None, self._heuristic_intent, prompt, max_pages)
+        heuristic, model_suggestion = await asyncio.gather(heuristic_task, model_task)
         intent = heuristic.merge(model_suggestion)
 
         if max_pages is not None:
@@ -141,10 +198,12 @@ class PromptPlanner:
             suggestion.notes.append("Intent derived from language model analysis.")
         return suggestion
 
-    def _heuristic_intent(self, prompt: str, *, max_pages: Optional[int]) -> IntentSuggestion:
+    def _heuristic_intent(self, prompt: str, max_pages: Optional[int]) -> IntentSuggestion:
+        prompt_lower = prompt.lower()
+        tokens = set(_TOKEN_RE.findall(prompt_lower))
         urls = self._extract_urls(prompt)
-        field_specs = self._infer_fields(prompt)
-        interactions = self._infer_interactions(prompt)
+        field_specs = self._infer_fields(prompt_lower, tokens)
+        interactions = self._infer_interactions(prompt_lower)
         requested_pages = max_pages or self._infer_requested_pages(prompt)
 
         notes: List[str] = []
@@ -162,34 +221,24 @@ class PromptPlanner:
         )
 
     def _extract_urls(self, prompt: str) -> List[str]:
-        urls = []
-        for match in _URL_RE.findall(prompt):
-            cleaned = match.rstrip(".,)'\"")
-            urls.append(cleaned)
-        return urls
-
-    def _infer_fields(self, prompt: str) -> List[FieldSpec]:
-        prompt_lower = prompt.lower()
-        tokens = set(re.findall(r"[a-zA-Z0-9]+", prompt_lower))
-        selected: List[FieldSpec] = []
+        return [_URL_TAIL_RE.sub("", match.group(0)) for match in _URL_RE.finditer(prompt)]
 
-        for name, field in self._library.items():
-            if name in tokens or any(token in field.synonyms for token in tokens):
-                selected.append(field.clone())
+    def _infer_fields(self, prompt_lower: str, tokens: set[str]) -> List[FieldSpec]:
+        hits = {self._synonym_index[token] for token in tokens if token in self._synonym_index}
 
         # Look for comma-separated lists preceding "from" as an extra hint.
         before_from = prompt_lower.split(" from ")[0]
-        candidates = re.split(r"[,/]| and ", before_from)
+        candidates = _FIELD_SPLIT_RE.split(before_from)
         for candidate in candidates:
             token = candidate.strip().split()[-1:] or []
             if not token:
                 continue
-            value = token[0]
-            for name, field in self._library.items():
-                if value in field.synonyms and not any(spec.name == name for spec in selected):
-                    selected.append(field.clone())
+            name = self._synonym_index.get(token[0])
+            if name:
+                hits.add(name)
 
-        return selected
+        # Preserve library order for stable field output.
+        return [spec.clone() for name, spec in self._library.items() if name in hits]
 
     def _infer_requested_pages(self, prompt: str) -> Optional[int]:
         match = _PAGE_RANGE_RE.search(prompt)
@@ -201,21 +250,21 @@ class PromptPlanner:
             return int(generic.group(1))
         return None
 
-    def _infer_interactions(self, prompt: str) -> List[InteractionStep]:
-        prompt_lower = prompt.lower()
+    def _infer_interactions(self, prompt_lower: str) -> List[InteractionStep]:
         interactions: List[InteractionStep] = []
+        hits = {tag for _, tag in self._kw_automaton.iter(prompt_lower)}
 
-        if any(keyword in prompt_lower for keyword in ["scroll", "infinite", "load more", "keep loading"]):
+        if "scroll" in hits:
             interactions.append(
                 InteractionStep(kind="scroll", count=5, wait_ms=400, note="Auto-scroll inferred from prompt."),
             )
 
-        if "wait" in prompt_lower and any(word in prompt_lower for word in ["appear", "render", "load"]):
+        if "wait" in hits and "ready" in hits:
             interactions.append(
                 InteractionStep(kind="wait", wait_ms=1500, note="Extra wait inferred from prompt."),
             )
 
-        if "click" in prompt_lower and "more" in prompt_lower:
+        if "click" in hits and "more" in hits:
             interactions.append(
                 InteractionStep(kind="click", selector="text=Load more", note="Attempt to click 'Load more'."),
             )
@@ -223,7 +272,11 @@ class PromptPlanner:
         return interactions
 
     def _infer_pagination(self, url: str) -> Optional[PaginationPlan]:
-        parsed = urlparse(url)
+        # Most URLs carry no pagination hint at all; skip the parse for those.
+        if "page=" not in url and "/page/" not in url:
+            return None
+
+        parsed = _cached_urlparse(url)
         query = parsed.query
         if "page=" in query:
             key = self._extract_page_parameter(query)
@@ -234,7 +287,7 @@ class PromptPlanner:
             return PaginationPlan(mode="query", parameter=key, start=start)
 
         # Detect `/page/<number>` patterns in the path.
-        match = re.search(r"/page/(\d+)", parsed.path)
+        match = _PAGE_PATH_RE.search(parsed.path)
         if match:
             start = int(match.group(1))
             template = parsed.path[: match.start(1)] + "{page}" + parsed.path[match.end(1) :]
@@ -275,15 +328,11 @@ class PromptPlanner:
 
     def _resolve_fields(self, field_names: Iterable[str]) -> List[FieldSpec]:
         resolved: List[FieldSpec] = []
+        seen: set[str] = set()
         for name in field_names:
-            candidate = self._library.get(name)
-            if candidate and not any(spec.name == candidate.name for spec in resolved):
-                resolved.append(candidate.clone())
-                continue
-
-            for field in self._library.values():
-                if name.lower() in field.synonyms and not any(spec.name == field.name for spec in resolved):
-                    resolved.append(field.clone())
-                    break
+            resolved_name = self._synonym_index.get(name) or self._synonym_index.get(name.lower())
+            if resolved_name and resolved_name not in seen:
+                seen.add(resolved_name)
+                resolved.append(self._library[resolved_name].clone())
 
         return resolved
@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-from urllib.parse import ParseResult, parse_qsl, urlencode, urlparse, urlunparse
+import functools
+import sys
+from dataclasses import InitVar, dataclass, field
+from itertools import chain, islice
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldSpec:
     """Describes a single logical field to extract from a page."""
 
     name: str
-    synonyms: List[str]
+    # Accepts any iterable of strings; canonicalized to a frozenset for O(1)
+    # membership tests, with ``synonyms_sorted`` kept for stable iteration.
+    synonyms: FrozenSet[str]
     value_type: str = "text"
     attribute_preferences: List[str] = field(default_factory=list)
     allow_partial: bool = False
-
-    def __post_init__(self) -> None:
-        self.synonyms = sorted({syn.lower() for syn in self.synonyms})
+    synonyms_sorted: Tuple[str, ...] = ()
+    # Set by clone(): the source values are already canonical, so the
+    # sort/dedup in __post_init__ can be skipped.
+    _normalized: InitVar[bool] = False
+
+    def __post_init__(self, _normalized: bool) -> None:
+        if _normalized:
+            return
+        # Interned synonyms make the scorer's equality checks and cache
+        # lookups pointer comparisons.
+        self.synonyms_sorted = tuple(sys.intern(syn) for syn in sorted({syn.lower() for syn in self.synonyms}))
+        self.synonyms = frozenset(self.synonyms_sorted)
         self.attribute_preferences = list(dict.fromkeys(self.attribute_preferences))
 
     def clone(self, *, name: Optional[str] = None) -> "FieldSpec":
@@ -26,14 +40,16 @@ class FieldSpec:
 
         return FieldSpec(
             name=name or self.name,
-            synonyms=list(self.synonyms),
+            synonyms=self.synonyms,
             value_type=self.value_type,
             attribute_preferences=list(self.attribute_preferences),
             allow_partial=self.allow_partial,
+            synonyms_sorted=self.synonyms_sorted,
+            _normalized=True,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionStep:
     """Describes a browser automation action executed before extraction."""
 
@@ -55,7 +71,7 @@ class InteractionStep:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginationPlan:
     """Represents a simple pagination strategy."""
 
@@ -74,52 +90,42 @@ class PaginationPlan:
             "step": self.step,
         }
 
+    # Sentinel substituted into the parsed URL once so each page URL is a
+    # plain string concatenation instead of a parse/unparse round-trip.
+    _SENTINEL = "\x00"
+
     def generate_urls(self, base_url: str, limit: int) -> List[str]:
         """Generate paginated URLs up to the provided limit."""
 
         if limit <= 0:
             return []
 
-        urls: List[str] = []
-        for offset in range(limit):
-            page_number = self.start + offset * self.step
-            if self.mode == "query" and self.parameter:
-                urls.append(self._build_query_url(base_url, page_number))
-            elif self.mode == "path" and self.template:
-                urls.append(self._build_path_url(base_url, page_number))
-            else:
-                break
-        return urls
-
-    def _build_query_url(self, base_url: str, page_number: int) -> str:
+        pages = (self.start + offset * self.step for offset in range(limit))
+        if self.mode == "query" and self.parameter:
+            head, tail = self._query_skeleton(base_url)
+            return [f"{head}{page_number}{tail}" for page_number in pages]
+        if self.mode == "path" and self.template:
+            head, tail = self._path_skeleton(base_url)
+            return [f"{head}{page_number}{tail}" for page_number in pages]
+        return []
+
+    def _query_skeleton(self, base_url: str) -> tuple[str, str]:
         parsed = urlparse(base_url)
         query = dict(parse_qsl(parsed.query, keep_blank_values=True))
-        query[self.parameter or "page"] = str(page_number)
-        encoded = urlencode(query, doseq=True)
-        return urlunparse(
-            ParseResult(
-                scheme=parsed.scheme,
-                netloc=parsed.netloc,
-                path=parsed.path,
-                params=parsed.params,
-                query=encoded,
-                fragment=parsed.fragment,
-            )
-        )
-
-    def _build_path_url(self, base_url: str, page_number: int) -> str:
+        key = self.parameter or "page"
+        query.pop(key, None)
+        others = urlencode(query, doseq=True)
+        encoded = f"{others}&{key}={self._SENTINEL}" if others else f"{key}={self._SENTINEL}"
+        skeleton = urlunparse(parsed._replace(query=encoded))
+        head, _, tail = skeleton.partition(self._SENTINEL)
+        return head, tail
+
+    def _path_skeleton(self, base_url: str) -> tuple[str, str]:
         parsed = urlparse(base_url)
-        path = (self.template or "{}").format(page=page_number)
-        return urlunparse(
-            ParseResult(
-                scheme=parsed.scheme,
-                netloc=parsed.netloc,
-                path=path,
-                params=parsed.params,
-                query=parsed.query,
-                fragment=parsed.fragment,
-            )
-        )
+        path = (self.template or "{}").format(page=self._SENTINEL)
+        skeleton = urlunparse(parsed._replace(path=path))
+        head, _, tail = skeleton.partition(self._SENTINEL)
+        return head, tail
 
 
 @dataclass
@@ -151,34 +157,20 @@ class ScrapePlan:
         """Expand the plan into concrete URLs to visit."""
 
         limit = max(1, limit)
-        urls: List[str] = []
 
-        # Primary seed URL with pagination support.
-        if self.pagination:
-            paginated = self.pagination.generate_urls(self.seed_url, limit)
-            urls.extend(paginated[:limit])
-        else:
-            urls.append(self.seed_url)
-
-        # Include any additional URLs requested explicitly in the prompt.
-        for url in self.extra_urls:
-            if len(urls) >= limit:
-                break
-            urls.append(url)
-
-        # Deduplicate while preserving order.
-        seen = set()
-        ordered: List[str] = []
-        for url in urls:
-            if url not in seen:
-                ordered.append(url)
-                seen.add(url)
-            if len(ordered) >= limit:
-                break
+        # Paginated seed URLs first, then any extra URLs from the prompt.
+        # dict.fromkeys dedupes while preserving insertion order, so the whole
+        # expansion is a single bounded pass.
+        source = (
+            self.pagination.generate_urls(self.seed_url, limit)
+            if self.pagination
+            else [self.seed_url]
+        )
+        ordered = list(dict.fromkeys(islice(chain(source, self.extra_urls), limit)))
         return ordered or [self.seed_url]
 
 
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Represents the outcome of fetching a page."""
 
@@ -230,8 +222,13 @@ class ScrapeOutcome:
         }
 
 
+@functools.lru_cache(maxsize=1)
 def default_field_library() -> Dict[str, FieldSpec]:
-    """Return the built-in catalogue of supported fields."""
+    """Return the built-in catalogue of supported fields.
+
+    The catalogue is built once and cached; callers shallow-copy the dict and
+    ``clone()`` individual specs before mutating them.
+    """
 
     return {
         "title": FieldSpec(